@@ -1,7 +1,13 @@
-from bs4 import BeautifulSoup
+from lxml import etree
+import re
 from typing import Dict
 import mcp
 
+from analyzer.text import iter_text
+
+# 기후 변화 관련 증거를 찾을 문단 태그
+EVIDENCE_TAGS = ("p", "h1", "h2", "h3", "li", "article")
+
 @mcp.tool()
 def find_keyword(
     html_uri: str,
@@ -33,20 +39,52 @@ def find_keyword(
         "evidence_paragraphs": [],
         "keyword": keyword
     }
-    with open(html_uri, 'r', encoding='utf-8') as docs:
-        soup = BeautifulSoup(docs, "lxml")
-        
-        #탐색 웹 제목
-        page_title = soup.title.string if soup.title else ""
-        result["title"] = page_title
+    keywords = keyword.split()
+    # 키워드를 하나의 정규식으로 묶어 대소문자 구분 없이 한 번에 검색
+    pattern = re.compile("|".join(re.escape(k) for k in keywords), re.IGNORECASE) if keywords else None
+    page_title = None
+    # 시작 태그 순서(문서 순서)대로 키워드를 포함한 문단 텍스트를 채울 자리
+    slots = []
+    open_slots = []
+    # 키워드를 포함해 채워진 자리 수
+    found = 0
+
+    # 파일을 한 번에 파서에 넣은 뒤 시작/종료 이벤트를 따라가며 제목과 문단 태그만 확인
+    # (libxml2는 나누어 읽은 블록의 경계가 </script> 같은 닫는 태그 중간에 걸리면 나머지 문서를 스크립트로 읽음)
+    with open(html_uri, 'rb') as docs:
+        parser = etree.HTMLPullParser(events=("start", "end"), encoding="utf-8")
+        parser.feed(docs.read())
+        parser.close()
+        for event, element in parser.read_events():
+            tag = element.tag
+            if event == "start":
+                if tag in EVIDENCE_TAGS:
+                    open_slots.append(len(slots))
+                    slots.append(None)
+                continue
+
+            if tag == "title":
+                #탐색 웹 제목 (문서의 첫 번째 title)
+                if page_title is None:
+                    page_title = element.text or ""
+            elif tag in EVIDENCE_TAGS:
+                slot = open_slots.pop()
+                text = " ".join(t.strip() for t in iter_text(element) if t.strip())
+                if text and pattern and pattern.search(text):
+                    slots[slot] = text
+                    found += 1
+
+            # 열려 있는 문단 태그가 없으면 처리가 끝난 요소와 앞선 형제 요소를 메모리에서 해제
+            # (문단 태그 안쪽 요소는 바깥 문단의 텍스트를 만들 때까지 유지)
+            if not open_slots:
+                element.clear(keep_tail=True)
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+                # 앞선 문단이 모두 처리되었고 결과 개수를 채웠으면 나머지 이벤트는 확인하지 않음
+                if found >= max_results and page_title is not None:
+                    break
 
-        keywords = keyword.lower().split()
-        paragraphs = soup.find_all("title")
-        
-        for p in paragraphs:
-            text = p.get_text(strip=True)
-            if text and any(keyword in text.lower() for keyword in keywords):
-                if len(result["evidence_paragraphs"]) < max_results:
-                    result["evidence_paragraphs"].append(text)
+    result["evidence_paragraphs"] = [text for text in slots if text][:max_results]
+    result["title"] = page_title or ""
     
     return result
\ No newline at end of file
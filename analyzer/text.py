@@ -0,0 +1,14 @@
+# BeautifulSoup의 get_text()처럼 텍스트에서 제외할 태그
+SKIP_TEXT_TAGS = ("script", "style", "template")
+
+def iter_text(element):
+    """
+    lxml 요소의 텍스트를 문서 순서대로 돌려줍니다. SKIP_TEXT_TAGS 내용과 주석은 건너뜁니다.
+    """
+    if element.text:
+        yield element.text
+    for child in element:
+        if isinstance(child.tag, str) and child.tag not in SKIP_TEXT_TAGS:
+            yield from iter_text(child)
+        if child.tail:
+            yield child.tail
@@ -1,13 +1,23 @@
 from fastmcp import FastMCP
 from bs4 import BeautifulSoup
-import requests
+import httpx
+import asyncio
+import codecs
+import concurrent.futures
+import lxml.cssselect
+import lxml.etree
+import lxml.html
 import json
 import os
 import hashlib
-import datetime
-from typing import List, Dict, Optional
+import re
+import time
+import functools
+from collections import deque
+from typing import List, Dict, Optional, Tuple
 
 import analyzer.keyword
+from analyzer.text import SKIP_TEXT_TAGS, iter_text
 
 # FastMCP 서버 초기화
 mcp = FastMCP(
@@ -65,6 +75,356 @@ CLIMATE_DOMAINS = {
     ]
 }
 
+# 웹사이트별 검색 URL 패턴 정의 (CLIMATE_DOMAINS에 있는 모든 도메인 포함)
+SEARCH_PATTERNS = {
+    # 일반적인 검색 패턴
+    "default": "{base_url}/search?q={query}",
+
+    # 사전 정의된 도메인별 검색 패턴
+    # 탄소배출 관련 사이트
+    "ipcc.ch": "{base_url}/search?query={query}",
+    "epa.gov": "{base_url}/search/site/{query}",
+    "carbonbrief.org": "{base_url}/?s={query}",
+
+    # 전기차 관련 사이트
+    "iea.org": "{base_url}/search?keywords={query}",
+    "ev-volumes.com": "{base_url}/search/?q={query}",
+    "cleantechnica.com": "{base_url}/?s={query}",
+
+    # 해수면상승 관련 사이트
+    "sealevel.nasa.gov": "{base_url}/search?search_api_fulltext={query}",
+    "climate.gov": "{base_url}/search/content/{query}",
+    "ocean.si.edu": "{base_url}/search?edan_q={query}",
+
+    # 기온 관련 사이트
+    "climate.nasa.gov": "{base_url}/search?q={query}",
+    "ncei.noaa.gov": "{base_url}/search?q={query}",
+    "data.giss.nasa.gov": "https://search.nasa.gov/search?query={query}&affiliate=nasa",
+
+    # 생태계 관련 사이트
+    "iucn.org": "{base_url}/search?key={query}",
+    "worldwildlife.org": "{base_url}/search?query={query}",
+    "nationalgeographic.com": "{base_url}/search?q={query}"
+}
+
+# 일부 사이트는 언어 파라미터를 지원합니다
+LANGUAGE_SUPPORTED_SITES = [
+    "ipcc.ch", "iucn.org", "iea.org", "climate.gov"
+]
+
+# 언어 코드 매핑
+LANG_CODES = {
+    "ko": "ko",
+    "en": "en",
+    "fr": "fr",
+    "es": "es",
+    "zh": "zh",
+    "ja": "ja"
+}
+
+@functools.lru_cache(maxsize=256)
+def _resolve_search_pattern(base_url: str) -> tuple:
+    """
+    base_url의 도메인에 맞는 검색 URL 패턴과 언어 파라미터 지원 여부를 반환합니다.
+    """
+    domain = base_url.split("//")[-1].split("/")[0].replace("www.", "")
+    pattern_key = next((k for k in SEARCH_PATTERNS if k in domain), "default")
+    lang_supported = any(site in domain for site in LANGUAGE_SUPPORTED_SITES)
+    return SEARCH_PATTERNS[pattern_key], lang_supported
+
+# 검색 결과 링크를 찾기 위한 CSS 선택자 (앞에 있을수록 우선)
+SEARCH_RESULT_SELECTORS = [
+    # 일반적인 검색 결과 컨테이너
+    "div.search-results a", ".search-result a", "article.search-result a",
+    "div.result a", "article.result a", "div.results a", "article.results a",
+    
+    # 검색 결과 리스트
+    "ul.search-results li a", "ol.search-results li a", 
+    "ul.results li a", "ol.results li a",
+    
+    # 특정 사이트별 선택자
+    ".ipcc-search-results a", ".nasa-search-results a", 
+    ".search-listing a", ".searchResults a", ".search-content a"
+]
+
+# 폴백 선택자 - 컨텐츠 영역의 링크 (SEARCH_RESULT_SELECTORS 다음에 시도)
+CONTENT_LINK_SELECTORS = [
+    "main a", "#content a", "#main-content a", ".content a", 
+    ".main-content a", "article a"
+]
+
+# SEARCH_RESULT_SELECTORS의 모든 클래스 이름에 들어 있는 문자열
+# 원본 HTML에 이 중 하나도 없으면 검색 결과 선택자는 일치할 수 없으므로 DOM 탐색을 생략
+SEARCH_RESULT_CLASS_HINT = re.compile(rb"result|search-listing|search-content", re.IGNORECASE)
+
+# 선택자를 import 시점에 한 번만 XPath로 컴파일
+COMPILED_SEARCH_RESULT_SELECTORS = [
+    lxml.cssselect.CSSSelector(selector, translator='html') for selector in SEARCH_RESULT_SELECTORS
+]
+COMPILED_CONTENT_LINK_SELECTORS = [
+    lxml.cssselect.CSSSelector(selector, translator='html') for selector in CONTENT_LINK_SELECTORS
+]
+
+# 검색 페이지 요청에 사용할 HTTP 헤더
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+# 동시에 진행할 최대 HTTP 요청 수
+MAX_CONCURRENCY = 10
+
+# HTTP 클라이언트가 유지할 최대 연결 수 (keep-alive 연결 포함)
+HTTP_POOL_SIZE = 16
+
+# ASCII 대문자를 소문자로 바꾸는 바이트 변환 테이블 (bytes.translate용)
+ASCII_LOWER = bytes.maketrans(bytes(range(65, 91)), bytes(range(97, 123)))
+
+# 스트리밍으로 응답 본문을 읽을 때의 조각 크기
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# 크롤링할 페이지의 최대 크기 (이보다 큰 응답은 받지 않음)
+MAX_PAGE_BYTES = 5_000_000
+
+# 크롤링할 응답의 미디어 타입 (Content-Type이 없는 응답은 허용)
+HTML_MEDIA_TYPES = {"text/html", "application/xhtml+xml"}
+
+# HTML 파일 저장을 네트워크 요청과 겹쳐서 처리하기 위한 스레드 풀
+_IO_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+
+def _new_client(headers: Optional[Dict[str, str]] = None) -> httpx.AsyncClient:
+    """
+    크롤러 도구 한 번의 호출 동안 공유할 HTTP 클라이언트를 생성합니다.
+    같은 호스트로의 TCP/TLS 연결을 keep-alive로 재사용합니다.
+    transport를 직접 넘기면 HTTP(S)_PROXY 환경 변수가 무시되므로 limits만 지정합니다.
+    """
+    limits = httpx.Limits(max_connections=HTTP_POOL_SIZE, max_keepalive_connections=HTTP_POOL_SIZE)
+    return httpx.AsyncClient(headers=headers, follow_redirects=True, limits=limits)
+
+async def _fetch(client: httpx.AsyncClient, url: str, timeout: float = 10) -> Optional[httpx.Response]:
+    """
+    URL을 비동기로 요청합니다. 요청 중 예외가 발생하면 None을 반환합니다.
+    """
+    try:
+        return await client.get(url, timeout=timeout)
+    except Exception:
+        return None
+
+async def _bounded(sem: asyncio.Semaphore, coro):
+    """
+    세마포어로 동시 실행 수를 제한하여 코루틴을 실행합니다.
+    차례를 기다리다 취소되면 시작하지 못한 코루틴을 닫아 둡니다.
+    """
+    try:
+        async with sem:
+            return await coro
+    finally:
+        coro.close()
+
+async def _gather_bounded(coros, sem: Optional[asyncio.Semaphore] = None) -> list:
+    """
+    코루틴들을 최대 MAX_CONCURRENCY개씩 동시에 실행하고, 입력과 같은 순서로 결과 목록을 반환합니다.
+    sem을 넘기면 그 세마포어를 공유하는 다른 요청과 합쳐서 동시 실행 수를 제한합니다.
+    """
+    if sem is None:
+        sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    return await asyncio.gather(*(_bounded(sem, coro) for coro in coros))
+
+async def _crawl_all(
+    client: httpx.AsyncClient,
+    urls: List[str],
+    timeout: float = 10,
+    sem: Optional[asyncio.Semaphore] = None
+) -> List[Optional[httpx.Response]]:
+    """
+    여러 URL을 동시에 요청하고, urls와 같은 순서로 응답 목록을 반환합니다.
+    """
+    return await _gather_bounded((_fetch(client, url, timeout) for url in urls), sem)
+
+async def _fetch_and_scan(
+    client: httpx.AsyncClient,
+    url: str,
+    keyword_pattern: "_KeywordPattern",
+    timeout: float = 10
+) -> Optional[Tuple[bytes, str, bool]]:
+    """
+    URL을 스트리밍으로 요청하여 MAX_PAGE_BYTES까지 본문을 받은 뒤 키워드 포함 여부를 검사합니다.
+    본문 전체를 문자열로 디코딩하거나 DOM을 만들지 않고도 키워드 포함 여부를 알 수 있습니다.
+    성공(200)하면 (본문 바이트, 문자셋, 키워드 포함 여부)를, 그 외에는 None을 반환합니다.
+    """
+    try:
+        async with client.stream("GET", url, timeout=timeout) as response:
+            # 본문을 받기 전에 헤더만 보고 HTML이 아니거나 너무 큰 응답은 건너뜀
+            if response.status_code != 200 or not _is_html_response(response):
+                return None
+            chunks = []
+            received = 0
+            async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                # Content-Length가 없는 응답도 MAX_PAGE_BYTES를 넘으면 중단
+                received += len(chunk)
+                if received > MAX_PAGE_BYTES:
+                    return None
+                chunks.append(chunk)
+            content = b"".join(chunks)
+            return content, response.encoding, _contains_keyword(content, response.encoding, keyword_pattern)
+    except Exception:
+        return None
+
+def _is_html_response(response: httpx.Response) -> bool:
+    """
+    응답 헤더의 Content-Type과 Content-Length로 크롤링할 HTML 페이지인지 확인합니다.
+    PDF, 이미지, 압축 파일 등과 MAX_PAGE_BYTES보다 큰 응답은 본문을 받기 전에 걸러냅니다.
+    """
+    media_type = response.headers.get('Content-Type', '').split(';', 1)[0].strip().lower()
+    if media_type and media_type not in HTML_MEDIA_TYPES:
+        return False
+    try:
+        content_length = int(response.headers.get('Content-Length') or 0)
+    except ValueError:
+        content_length = 0
+    return content_length <= MAX_PAGE_BYTES
+
+def _lxml_tree(content: bytes, encoding: str):
+    """
+    HTML 본문 바이트를 lxml HTML 트리로 파싱합니다.
+    응답 헤더의 문자셋(없으면 UTF-8)으로 바이트를 직접 해석하며, 빈 본문은 빈 문서로 반환합니다.
+    """
+    parser = lxml.html.HTMLParser(encoding=encoding)
+    try:
+        return lxml.html.document_fromstring(content, parser=parser)
+    except lxml.etree.ParserError:
+        # 빈 본문(공백만 있는 경우 포함)은 링크가 없는 빈 문서로 취급
+        return lxml.html.Element("html")
+
+def _to_utf8(content: bytes, encoding: str) -> bytes:
+    """
+    HTML 본문 바이트를 UTF-8 바이트로 맞춥니다. 이미 UTF-8(또는 ASCII)이면 디코딩 없이 그대로 반환합니다.
+    """
+    if codecs.lookup(encoding).name in ("utf-8", "ascii"):
+        return content
+    return content.decode(encoding, errors='replace').encode('utf-8')
+
+def _write_file(filename: str, content: bytes, encoding: str):
+    """
+    HTML 본문 바이트를 UTF-8 파일로 저장합니다. 큰 페이지의 쓰기 시스템 호출 수를 줄이기 위해 1MiB 버퍼를 사용합니다.
+    """
+    data = _to_utf8(content, encoding)
+    with open(filename, 'wb', buffering=1 << 20) as f:
+        f.write(data)
+
+def _submit_write(filename: str, content: bytes, encoding: str) -> asyncio.Future:
+    """
+    파일 저장(필요한 경우 UTF-8 변환 포함)을 _IO_POOL에 맡겨 네트워크 요청과 겹쳐서 진행되도록 합니다.
+    """
+    return asyncio.get_running_loop().run_in_executor(_IO_POOL, _write_file, filename, content, encoding)
+
+async def _collect_writes(pending_writes: list, results: Dict):
+    """
+    예약된 파일 저장이 모두 끝날 때까지 기다린 뒤, 저장에 성공한 페이지만 results에 추가합니다.
+    pending_writes는 (URL, 파일 경로, Future) 튜플의 목록이며, 처리한 뒤 비웁니다.
+    기다리는 도중 호출이 취소되어도 저장 작업 자체는 취소되지 않도록 shield로 감쌉니다.
+    """
+    outcomes = await asyncio.shield(asyncio.gather(*(write for _, _, write in pending_writes), return_exceptions=True))
+    for (url, filename, _), outcome in zip(pending_writes, outcomes):
+        if not isinstance(outcome, Exception):
+            results["urls"].append(url)
+            results["file_paths"].append(filename)
+    pending_writes.clear()
+
+def _link_text(link) -> str:
+    """
+    링크 요소의 텍스트를 BeautifulSoup의 get_text(strip=True)와 같은 방식으로 반환합니다.
+    """
+    return "".join(text.strip() for text in iter_text(link))
+
+class _HrefCollector:
+    """
+    lxml 파서 타깃으로 사용되어 DOM을 만들지 않고 <a> 태그의 href 값만 문서 순서대로 모읍니다.
+    """
+    def __init__(self):
+        self.hrefs = []
+
+    def start(self, tag, attrib):
+        if tag == "a":
+            href = attrib.get("href")
+            if href is not None:
+                self.hrefs.append(href)
+
+    def close(self):
+        return self.hrefs
+
+def _extract_hrefs(content: bytes, encoding: str) -> List[str]:
+    """
+    HTML 본문 바이트에서 링크(href) 목록을 추출합니다. 트리를 만들지 않으므로 _lxml_tree보다 가볍습니다.
+    """
+    parser = lxml.etree.HTMLParser(target=_HrefCollector(), encoding=encoding)
+    return lxml.etree.fromstring(content, parser)
+
+class _KeywordFound(Exception):
+    """
+    키워드를 찾았을 때 파싱을 조기에 중단하기 위해 사용하는 예외
+    """
+
+class _KeywordPattern:
+    """
+    키워드 목록을 소문자 바이트 정규식 하나로 컴파일한 결과입니다.
+    도구 호출마다 한 번만 만들어 모든 페이지의 _KeywordFinder가 공유합니다.
+    """
+    def __init__(self, keywords: List[str]):
+        needles = [keyword.lower().encode() for keyword in keywords]
+        # 모든 키워드를 하나의 정규식으로 묶어 C 수준에서 한 번에 검색
+        self.regex = re.compile(b"|".join(re.escape(needle) for needle in needles)) if needles else None
+        # 텍스트 노드 경계에 걸친 키워드를 찾기 위해 유지할 바이트 수
+        self.keep = max((len(needle) for needle in needles), default=1) - 1
+
+class _KeywordFinder:
+    """
+    lxml 파서 타깃으로 사용되어 DOM을 만들지 않고 문서 텍스트에서 키워드를 찾습니다.
+    BeautifulSoup의 get_text()와 같이 script/style 내용은 건너뛰며,
+    텍스트 노드 경계에 걸친 키워드를 위해 직전 텍스트의 끝부분만 유지합니다.
+    """
+    def __init__(self, keyword_pattern: _KeywordPattern):
+        self.pattern = keyword_pattern.regex
+        self.keep = keyword_pattern.keep
+        self.tail = b""
+        self.skip_depth = 0
+
+    def start(self, tag, attrib):
+        if tag in SKIP_TEXT_TAGS:
+            self.skip_depth += 1
+
+    def end(self, tag):
+        if tag in SKIP_TEXT_TAGS and self.skip_depth:
+            self.skip_depth -= 1
+
+    def data(self, text):
+        if self.skip_depth or self.pattern is None:
+            return
+        # ASCII 텍스트는 str.lower()로 새 문자열을 만들지 않고 바이트 테이블로 소문자화
+        if text.isascii():
+            chunk = text.encode().translate(ASCII_LOWER)
+        else:
+            chunk = text.lower().encode()
+        window = self.tail + chunk
+        if self.pattern.search(window):
+            raise _KeywordFound()
+        self.tail = window[-self.keep:] if self.keep else b""
+
+    def close(self):
+        return False
+
+def _contains_keyword(content: bytes, encoding: str, keyword_pattern: _KeywordPattern) -> bool:
+    """
+    HTML 본문 바이트를 _KeywordFinder 타깃 파서에 한 번에 넣어 키워드 포함 여부를 검사합니다.
+    libxml2는 나누어 넣은 조각의 경계가 </script> 같은 닫는 태그 중간에 걸리면
+    나머지 문서를 스크립트 내용으로 읽으므로, 본문을 조각 단위로 넣지 않습니다.
+    """
+    parser = lxml.etree.HTMLParser(target=_KeywordFinder(keyword_pattern), encoding=encoding)
+    try:
+        parser.feed(content)
+        return parser.close()
+    except _KeywordFound:
+        return True
+
 @mcp.tool()
 def html_analyzer(
     html_content: str,
@@ -101,7 +461,7 @@ def html_analyzer(
         - 'elements': 검색 조건에 맞는 요소 목록
     """
     result = {}
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(html_content, 'lxml')
     
     # 텍스트만 추출
     if extract_text_only:
@@ -136,7 +496,7 @@ def html_analyzer(
     return result
 
 @mcp.tool()
-def climate_domain_crawler(
+async def climate_domain_crawler(
     category: str,
     keywords: List[str],
     max_pages: int = 5
@@ -174,43 +534,50 @@ def climate_domain_crawler(
         "keywords": keywords
     }
     
-    # 간단한 웹 크롤링 구현 (Scrapy 대신 requests 사용)
+    # 간단한 웹 크롤링 구현 (Scrapy 대신 httpx로 모든 도메인을 동시에 요청)
     domains = CLIMATE_DOMAINS[category]
     pages_crawled = 0
-    
-    for domain in domains:
-        if pages_crawled >= max_pages:
-            break
-            
-        try:
-            response = requests.get(domain, timeout=10)
-            if response.status_code == 200:
-                html_content = response.text
-                
-                # 키워드 기반 필터링
-                soup = BeautifulSoup(html_content, 'html.parser')
-                text_content = soup.get_text().lower()
-                
-                # 키워드 매칭 확인
-                if any(keyword.lower() in text_content for keyword in keywords):
-                    # HTML 파일 저장
-                    timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
-                    domain_hash = hashlib.md5(domain.encode()).hexdigest()[:8]
-                    filename = f"{RESOURCE_DIR}/climate_{category}_{domain_hash}_{timestamp}.html"
-                    
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        f.write(html_content)
+    # 파일 이름에 붙일 일련번호 (저장 확인 후 pending_writes를 비워도 겹치지 않도록 따로 셈)
+    file_index = 0
+    pending_writes = []
+    keyword_pattern = _KeywordPattern(keywords)
+    timestamp = time.strftime("%Y%m%d%H%M%S")
+
+    try:
+        async with _new_client() as client:
+            pages = await _gather_bounded(_fetch_and_scan(client, domain, keyword_pattern) for domain in domains)
+
+        for domain, page in zip(domains, pages):
+            if pages_crawled >= max_pages:
+                break
+
+            try:
+                if page is not None:
+                    content, encoding, matched = page
                     
-                    results["urls"].append(domain)
-                    results["file_paths"].append(filename)
-                    pages_crawled += 1
-        except Exception as e:
-            continue
+                    # 키워드 기반 필터링 (다운로드하면서 스트리밍으로 검사한 결과)
+                    if matched:
+                        # HTML 파일 저장
+                        domain_hash = hashlib.blake2b(domain.encode(), digest_size=4).hexdigest()
+                        filename = f"{RESOURCE_DIR}/climate_{category}_{domain_hash}_{timestamp}_{file_index:03d}.html"
+                        file_index += 1
+                        
+                        pending_writes.append((domain, filename, _submit_write(filename, content, encoding)))
+                        pages_crawled += 1
+                        # max_pages에 도달하면 저장 결과를 확인하고, 저장에 실패한 페이지 수만큼 다음 페이지로 채움
+                        if pages_crawled >= max_pages:
+                            await _collect_writes(pending_writes, results)
+                            pages_crawled = len(results["urls"])
+            except Exception as e:
+                continue
+    finally:
+        # 호출이 취소되더라도 예약된 파일 저장이 모두 끝날 때까지 대기
+        await _collect_writes(pending_writes, results)
     
     return results
 
 @mcp.tool()
-def custom_url_crawler(
+async def custom_url_crawler(
     start_url: str,
     keywords: List[str],
     max_pages: int = 5,
@@ -244,60 +611,74 @@ def custom_url_crawler(
         "keywords": keywords
     }
     
-    # 크롤링 구현 (Scrapy 대신 requests 사용)
+    # 크롤링 구현 (Scrapy 대신 httpx 사용, 대기 중인 URL을 묶어서 동시에 요청)
     pages_crawled = 0
-    urls_to_visit = [start_url]
+    urls_to_visit = deque([start_url])
     visited_urls = set()
-    
-    while urls_to_visit and pages_crawled < max_pages:
-        current_url = urls_to_visit.pop(0)
-        
-        if current_url in visited_urls:
-            continue
-            
-        visited_urls.add(current_url)
-        
-        try:
-            response = requests.get(current_url, timeout=10)
-            if response.status_code == 200:
-                html_content = response.text
-                
-                # 키워드 기반 필터링
-                soup = BeautifulSoup(html_content, 'html.parser')
-                text_content = soup.get_text().lower()
-                
-                # 키워드 매칭 확인
-                if any(keyword.lower() in text_content for keyword in keywords):
-                    # HTML 파일 저장
-                    timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
-                    url_hash = hashlib.md5(current_url.encode()).hexdigest()[:8]
-                    filename = f"{RESOURCE_DIR}/custom_{url_hash}_{timestamp}.html"
-                    
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        f.write(html_content)
-                    
-                    results["urls"].append(current_url)
-                    results["file_paths"].append(filename)
-                    pages_crawled += 1
-                
-                # 다음 링크 추가
-                if follow_links:
-                    for link in soup.find_all('a', href=True):
-                        href = link['href']
-                        # 상대 URL을 절대 URL로 변환
-                        if href.startswith('/'):
-                            from urllib.parse import urlparse
-                            parsed_url = urlparse(current_url)
-                            next_url = f"{parsed_url.scheme}://{parsed_url.netloc}{href}"
-                        elif href.startswith('http'):
-                            next_url = href
-                        else:
-                            continue
+    # 한 번이라도 대기열에 들어간 URL (urls_to_visit 리스트를 매번 순회하지 않도록)
+    queued_urls = {start_url}
+    # 파일 이름에 붙일 일련번호 (저장 확인 후 pending_writes를 비워도 겹치지 않도록 따로 셈)
+    file_index = 0
+    pending_writes = []
+    keyword_pattern = _KeywordPattern(keywords)
+    timestamp = time.strftime("%Y%m%d%H%M%S")
+
+    try:
+        async with _new_client() as client:
+            while urls_to_visit and pages_crawled < max_pages:
+                batch = []
+                while urls_to_visit and len(batch) < MAX_CONCURRENCY:
+                    current_url = urls_to_visit.popleft()
+                    if current_url in visited_urls:
+                        continue
+                    visited_urls.add(current_url)
+                    batch.append(current_url)
+
+                pages = await _gather_bounded(_fetch_and_scan(client, url, keyword_pattern) for url in batch)
+
+                for current_url, page in zip(batch, pages):
+                    if pages_crawled >= max_pages:
+                        break
+
+                    try:
+                        if page is not None:
+                            content, encoding, matched = page
                             
-                        if next_url not in visited_urls and next_url not in urls_to_visit:
-                            urls_to_visit.append(next_url)
-        except Exception as e:
-            continue
+                            # 키워드 기반 필터링 (다운로드하면서 스트리밍으로 검사한 결과)
+                            if matched:
+                                # HTML 파일 저장
+                                url_hash = hashlib.blake2b(current_url.encode(), digest_size=4).hexdigest()
+                                filename = f"{RESOURCE_DIR}/custom_{url_hash}_{timestamp}_{file_index:03d}.html"
+                                file_index += 1
+                                
+                                pending_writes.append((current_url, filename, _submit_write(filename, content, encoding)))
+                                pages_crawled += 1
+                                # max_pages에 도달하면 저장 결과를 확인하고, 저장에 실패한 페이지 수만큼 다음 페이지로 채움
+                                if pages_crawled >= max_pages:
+                                    await _collect_writes(pending_writes, results)
+                                    pages_crawled = len(results["urls"])
+                            
+                            # 다음 링크 추가 (링크를 따라가는 경우에만 트리 없이 href만 추출)
+                            if follow_links:
+                                for href in _extract_hrefs(content, encoding):
+                                    # 상대 URL을 절대 URL로 변환
+                                    if href.startswith('/'):
+                                        from urllib.parse import urlparse
+                                        parsed_url = urlparse(current_url)
+                                        next_url = f"{parsed_url.scheme}://{parsed_url.netloc}{href}"
+                                    elif href.startswith('http'):
+                                        next_url = href
+                                    else:
+                                        continue
+                                        
+                                    if next_url not in queued_urls:
+                                        queued_urls.add(next_url)
+                                        urls_to_visit.append(next_url)
+                    except Exception as e:
+                        continue
+    finally:
+        # 호출이 취소되더라도 예약된 파일 저장이 모두 끝날 때까지 대기
+        await _collect_writes(pending_writes, results)
     
     return results
 
@@ -314,8 +695,187 @@ def get_supported_climate_categories() -> List[str]:
     return list(CLIMATE_DOMAINS.keys())
 
 
+async def _search_keyword(
+    client: httpx.AsyncClient,
+    base_url: str,
+    keyword: str,
+    search_url: str,
+    max_results: int,
+    timestamp: str,
+    domain_hash: str,
+    pending_writes: list,
+    sem: asyncio.Semaphore
+) -> Dict:
+    """
+    search_based_crawler의 키워드 하나에 대한 검색과 결과 페이지 수집을 수행합니다.
+    
+    Returns:
+    --------
+    Dict
+        이 키워드에 대한 항목만 채운 search_based_crawler 결과 형태의 사전
+        (파일 저장은 pending_writes에 예약만 하고 기다리지 않음)
+        HTTP 요청은 모든 키워드가 공유하는 sem으로 동시 실행 수를 제한합니다.
+    """
+    results = {
+        "search_results": {keyword: []},
+        "search_method": {}
+    }
+    
+    try:
+        async with sem:
+            response = await client.get(search_url, timeout=15)
+        
+        if response.status_code == 200:
+            tree = _lxml_tree(response.content, response.encoding)
+            
+            # 검색 결과 링크 추출 - 웹사이트마다 선택자가 다를 수 있음
+            search_results = []
+            # 중복 확인용 URL 집합 (search_results를 매번 순회하지 않도록)
+            seen_urls = set()
+            
+            # 원본 HTML에 검색 결과 클래스 이름이 없으면 컨텐츠 영역 선택자만 시도
+            selectors = COMPILED_CONTENT_LINK_SELECTORS
+            if SEARCH_RESULT_CLASS_HINT.search(response.content):
+                selectors = COMPILED_SEARCH_RESULT_SELECTORS + COMPILED_CONTENT_LINK_SELECTORS
+            
+            # 각 선택자 시도 (미리 컴파일된 XPath로 C 수준에서 탐색)
+            for selector in selectors:
+                links = selector(tree)
+                if links:
+                    for link in links[:max_results]:
+                        href = link.get('href', '')
+                        title = _link_text(link)
+                        
+                        # 빈 링크나 자바스크립트 링크 건너뛰기
+                        if not href or href.startswith(('javascript:', '#')):
+                            continue
+                            
+                        # 상대 URL을 절대 URL로 변환
+                        if href.startswith('/'):
+                            href = base_url.rstrip('/') + href
+                        elif not href.startswith(('http://', 'https://')):
+                            # 상대 경로를 base_url에 추가
+                            href = f"{base_url.rstrip('/')}/{href.lstrip('/')}"
+                        
+                        # 중복 방지
+                        if href in seen_urls:
+                            continue
+                            
+                        if title and len(title.strip()) > 0:
+                            seen_urls.add(href)
+                            search_results.append({
+                                'title': title,
+                                'url': href
+                            })
+                    
+                    # 충분한 결과를 찾았으면 선택자 루프 종료
+                    if len(search_results) >= max_results:
+                        # 정확한 검색 방법으로 찾았음을 표시
+                        results["search_method"][keyword] = "exact"
+                        break
+            
+            # 선택자로 찾지 못한 경우 대안 방법 - 키워드가 포함된 모든 링크 추출
+            if not search_results:
+                # 폴백 방법으로 찾고 있음을 표시
+                results["search_method"][keyword] = "fallback"
+                
+                for link in tree.xpath('//a[@href]'):
+                    href = link.get('href', '')
+                    text = _link_text(link)
+                    
+                    # 빈 링크나 자바스크립트 링크 건너뛰기
+                    if not href or href.startswith(('javascript:', '#')):
+                        continue
+                        
+                    # 키워드가 링크 텍스트에 포함된 경우만 추출
+                    if keyword.lower() in text.lower() and len(text) > 3:
+                        # 상대 URL을 절대 URL로 변환
+                        if href.startswith('/'):
+                            href = base_url.rstrip('/') + href
+                        elif not href.startswith(('http://', 'https://')):
+                            href = f"{base_url.rstrip('/')}/{href.lstrip('/')}"
+                        
+                        # 중복 방지
+                        if href in seen_urls:
+                            continue
+                        seen_urls.add(href)
+                            
+                        search_results.append({
+                            'title': text,
+                            'url': href
+                        })
+                        
+                        if len(search_results) >= max_results:
+                            break
+            
+            # 결과에 검색 결과 추가
+            # 검색 결과가 있는 페이지도 저장
+            if search_results:
+                search_filename = f"{RESOURCE_DIR}/search_{domain_hash}_{keyword.replace(' ', '_')}_{timestamp}_{len(pending_writes):03d}.html"
+                
+                pending_writes.append((None, search_filename, _submit_write(search_filename, response.content, response.encoding)))
+            
+                # 개별 검색 결과 페이지도 동시에 크롤링하여 저장
+                result_responses = await _crawl_all(client, [result['url'] for result in search_results], sem=sem)
+                for result, result_response in zip(search_results, result_responses):
+                    if result_response is None:
+                        # 개별 결과 페이지 요청 실패시 무시
+                        result['file_path'] = None
+                        continue
+                    try:
+                        result_url = result['url']
+                        if result_response.status_code == 200:
+                            # 파일 저장
+                            url_hash = hashlib.blake2b(result_url.encode(), digest_size=4).hexdigest()
+                            filename = f"{RESOURCE_DIR}/result_{domain_hash}_{url_hash}_{timestamp}_{len(pending_writes):03d}.html"
+                            
+                            # 파일 경로는 저장이 끝난 뒤 추가
+                            pending_writes.append((result, filename, _submit_write(filename, result_response.content, result_response.encoding)))
+                    except Exception as e:
+                        # 개별 결과 페이지 크롤링 실패시 무시
+                        result['file_path'] = None
+                        continue
+                
+                results["search_results"][keyword] = search_results
+                
+                # 검색 방법에 대한 설명 추가
+                search_method = results["search_method"].get(keyword, "unknown")
+                if search_method == "exact":
+                    results.setdefault("descriptions", {})[keyword] = "웹사이트의 검색 결과 영역에서 정확하게 추출된 검색 결과입니다."
+                else:  # fallback
+                    results.setdefault("descriptions", {})[keyword] = "웹사이트의 검색 결과 영역을 찾지 못해 페이지 내 키워드 관련 링크로 대체했습니다."
+            else:
+                # 검색 결과가 없는 경우
+                results["search_results"][keyword] = []
+                results["search_method"][keyword] = "failed"
+                results.setdefault("descriptions", {})[keyword] = "검색 결과를 찾지 못했습니다."
+            
+            # 디버그 정보 추가 (실제 사용시 제거 가능)
+            results["debug"] = {
+                "search_url": search_url,
+                "found_results": len(search_results)
+            }
+            
+    except Exception as e:
+        # 에러 정보 추가 (실제 사용시 제거 가능)
+        if "search_results" not in results:
+            results["search_results"] = {}
+        if keyword not in results["search_results"]:
+            results["search_results"][keyword] = []
+        
+        # 오류 발생 시 검색 방법 표시
+        results["search_method"][keyword] = "error"
+        results.setdefault("descriptions", {})[keyword] = f"검색 중 오류가 발생했습니다: {str(e)[:100]}"
+        
+        results["errors"] = {
+            "message": str(e),
+            "search_url": search_url
+        }
+    
+    return results
+
 @mcp.tool()
-def search_based_crawler(
+async def search_based_crawler(
     base_url: str,
     keywords: List[str],
     max_results: int = 10,
@@ -351,240 +911,54 @@ def search_based_crawler(
         "search_method": {}  # 검색 방법을 저장할 새 필드
     }
     
-    # 웹사이트별 검색 URL 패턴 정의 (CLIMATE_DOMAINS에 있는 모든 도메인 포함)
-    search_patterns = {
-        # 일반적인 검색 패턴
-        "default": "{base_url}/search?q={query}",
-        
-        # 사전 정의된 도메인별 검색 패턴
-        # 탄소배출 관련 사이트
-        "ipcc.ch": "{base_url}/search?query={query}",
-        "epa.gov": "{base_url}/search/site/{query}",
-        "carbonbrief.org": "{base_url}/?s={query}",
-        
-        # 전기차 관련 사이트
-        "iea.org": "{base_url}/search?keywords={query}",
-        "ev-volumes.com": "{base_url}/search/?q={query}",
-        "cleantechnica.com": "{base_url}/?s={query}",
-        
-        # 해수면상승 관련 사이트
-        "sealevel.nasa.gov": "{base_url}/search?search_api_fulltext={query}",
-        "climate.gov": "{base_url}/search/content/{query}",
-        "ocean.si.edu": "{base_url}/search?edan_q={query}",
-        
-        # 기온 관련 사이트
-        "climate.nasa.gov": "{base_url}/search?q={query}",
-        "ncei.noaa.gov": "{base_url}/search?q={query}",
-        "data.giss.nasa.gov": "https://search.nasa.gov/search?query={query}&affiliate=nasa",
-        
-        # 생태계 관련 사이트
-        "iucn.org": "{base_url}/search?key={query}",
-        "worldwildlife.org": "{base_url}/search?query={query}",
-        "nationalgeographic.com": "{base_url}/search?q={query}"
-    }
+    lang = LANG_CODES.get(language, "en")
     
-    # 일부 사이트는 언어 파라미터를 지원합니다
-    language_supported_sites = [
-        "ipcc.ch", "iucn.org", "iea.org", "climate.gov"
-    ]
-    
-    # 언어 코드 매핑
-    lang_codes = {
-        "ko": "ko",
-        "en": "en",
-        "fr": "fr",
-        "es": "es",
-        "zh": "zh",
-        "ja": "ja"
-    }
+    pending_writes = []
+    timestamp = time.strftime("%Y%m%d%H%M%S")
+    domain_hash = hashlib.blake2b(base_url.encode(), digest_size=4).hexdigest()
     
-    lang = lang_codes.get(language, "en")
+    # 웹사이트 도메인에 맞는 검색 패턴 선택 (키워드마다 반복하지 않도록 한 번만 계산)
+    search_pattern, lang_supported = _resolve_search_pattern(base_url)
     
+    search_urls = []
     for keyword in keywords:
-        results["search_results"][keyword] = []
-        
-        # 웹사이트 도메인에 맞는 검색 패턴 선택
-        domain = base_url.split("//")[-1].split("/")[0].replace("www.", "")
-        pattern_key = next((k for k in search_patterns.keys() if k in domain), "default")
-        search_pattern = search_patterns[pattern_key]
-        
         # 검색 URL 생성
         query = keyword.replace(" ", "+")
         search_url = search_pattern.format(base_url=base_url, query=query)
         
         # 언어 지원 사이트인 경우 언어 파라미터 추가
-        if any(site in domain for site in language_supported_sites):
+        if lang_supported:
             if "?" in search_url:
                 search_url += f"&lang={lang}"
             else:
                 search_url += f"?lang={lang}"
         
-        try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            }
-            response = requests.get(search_url, headers=headers, timeout=15)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # 검색 결과 링크 추출 - 웹사이트마다 선택자가 다를 수 있음
-                search_results = []
-                
-                # 일반적인 검색 결과 선택자들
-                selectors = [
-                    # 일반적인 검색 결과 컨테이너
-                    "div.search-results a", ".search-result a", "article.search-result a",
-                    "div.result a", "article.result a", "div.results a", "article.results a",
-                    
-                    # 검색 결과 리스트
-                    "ul.search-results li a", "ol.search-results li a", 
-                    "ul.results li a", "ol.results li a",
-                    
-                    # 특정 사이트별 선택자
-                    ".ipcc-search-results a", ".nasa-search-results a", 
-                    ".search-listing a", ".searchResults a", ".search-content a",
-                    
-                    # 폴백 선택자 - 컨텐츠 영역의 링크
-                    "main a", "#content a", "#main-content a", ".content a", 
-                    ".main-content a", "article a"
-                ]
-                
-                # 각 선택자 시도
-                for selector in selectors:
-                    links = soup.select(selector)
-                    if links:
-                        for link in links[:max_results]:
-                            href = link.get('href', '')
-                            title = link.get_text(strip=True)
-                            
-                            # 빈 링크나 자바스크립트 링크 건너뛰기
-                            if not href or href.startswith(('javascript:', '#')):
-                                continue
-                                
-                            # 상대 URL을 절대 URL로 변환
-                            if href.startswith('/'):
-                                href = base_url.rstrip('/') + href
-                            elif not href.startswith(('http://', 'https://')):
-                                # 상대 경로를 base_url에 추가
-                                href = f"{base_url.rstrip('/')}/{href.lstrip('/')}"
-                            
-                            # 중복 방지
-                            if any(r['url'] == href for r in search_results):
-                                continue
-                                
-                            if title and len(title.strip()) > 0:
-                                search_results.append({
-                                    'title': title,
-                                    'url': href
-                                })
-                        
-                        # 충분한 결과를 찾았으면 선택자 루프 종료
-                        if len(search_results) >= max_results:
-                            # 정확한 검색 방법으로 찾았음을 표시
-                            results["search_method"][keyword] = "exact"
-                            break
-                
-                # 선택자로 찾지 못한 경우 대안 방법 - 키워드가 포함된 모든 링크 추출
-                if not search_results:
-                    # 폴백 방법으로 찾고 있음을 표시
-                    results["search_method"][keyword] = "fallback"
-                    
-                    for link in soup.find_all('a', href=True):
-                        href = link.get('href', '')
-                        text = link.get_text(strip=True)
-                        
-                        # 빈 링크나 자바스크립트 링크 건너뛰기
-                        if not href or href.startswith(('javascript:', '#')):
-                            continue
-                            
-                        # 키워드가 링크 텍스트에 포함된 경우만 추출
-                        if keyword.lower() in text.lower() and len(text) > 3:
-                            # 상대 URL을 절대 URL로 변환
-                            if href.startswith('/'):
-                                href = base_url.rstrip('/') + href
-                            elif not href.startswith(('http://', 'https://')):
-                                href = f"{base_url.rstrip('/')}/{href.lstrip('/')}"
-                            
-                            # 중복 방지
-                            if any(r['url'] == href for r in search_results):
-                                continue
-                                
-                            search_results.append({
-                                'title': text,
-                                'url': href
-                            })
-                            
-                            if len(search_results) >= max_results:
-                                break
-                
-                # 결과에 검색 결과 추가
-                # 검색 결과가 있는 페이지도 저장
-                if search_results:
-                    timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
-                    domain_hash = hashlib.md5(base_url.encode()).hexdigest()[:8]
-                    search_filename = f"{RESOURCE_DIR}/search_{domain_hash}_{keyword.replace(' ', '_')}_{timestamp}.html"
-                    
-                    with open(search_filename, 'w', encoding='utf-8') as f:
-                        f.write(response.text)
-                
-                    # 개별 검색 결과 페이지도 크롤링하여 저장
-                    for result in search_results:
-                        try:
-                            result_url = result['url']
-                            result_response = requests.get(result_url, headers=headers, timeout=10)
-                            if result_response.status_code == 200:
-                                # 파일 저장
-                                timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
-                                url_hash = hashlib.md5(result_url.encode()).hexdigest()[:8]
-                                filename = f"{RESOURCE_DIR}/result_{domain_hash}_{url_hash}_{timestamp}.html"
-                                
-                                with open(filename, 'w', encoding='utf-8') as f:
-                                    f.write(result_response.text)
-                                
-                                # 파일 경로 추가
-                                result['file_path'] = filename
-                        except Exception as e:
-                            # 개별 결과 페이지 크롤링 실패시 무시
-                            result['file_path'] = None
-                            continue
-                    
-                    results["search_results"][keyword] = search_results
-                    
-                    # 검색 방법에 대한 설명 추가
-                    search_method = results["search_method"].get(keyword, "unknown")
-                    if search_method == "exact":
-                        results.setdefault("descriptions", {})[keyword] = "웹사이트의 검색 결과 영역에서 정확하게 추출된 검색 결과입니다."
-                    else:  # fallback
-                        results.setdefault("descriptions", {})[keyword] = "웹사이트의 검색 결과 영역을 찾지 못해 페이지 내 키워드 관련 링크로 대체했습니다."
-                else:
-                    # 검색 결과가 없는 경우
-                    results["search_results"][keyword] = []
-                    results["search_method"][keyword] = "failed"
-                    results.setdefault("descriptions", {})[keyword] = "검색 결과를 찾지 못했습니다."
-                
-                # 디버그 정보 추가 (실제 사용시 제거 가능)
-                results["debug"] = {
-                    "search_url": search_url,
-                    "found_results": len(search_results)
-                }
-                
-        except Exception as e:
-            # 에러 정보 추가 (실제 사용시 제거 가능)
-            if "search_results" not in results:
-                results["search_results"] = {}
-            if keyword not in results["search_results"]:
-                results["search_results"][keyword] = []
-            
-            # 오류 발생 시 검색 방법 표시
-            results["search_method"][keyword] = "error"
-            results.setdefault("descriptions", {})[keyword] = f"검색 중 오류가 발생했습니다: {str(e)[:100]}"
-            
-            results["errors"] = {
-                "message": str(e),
-                "search_url": search_url
-            }
-            continue
+        search_urls.append(search_url)
+    
+    # 모든 키워드의 HTTP 요청을 합쳐 최대 MAX_CONCURRENCY개로 제한
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    
+    try:
+        async with _new_client(HEADERS) as client:
+            # 모든 키워드의 검색을 한 번에 동시 실행하고, 키워드 순서대로 결과를 합침
+            keyword_results = await asyncio.gather(*(
+                _search_keyword(client, base_url, keyword, search_url, max_results, timestamp, domain_hash, pending_writes, sem)
+                for keyword, search_url in zip(keywords, search_urls)
+            ))
+            for keyword_result in keyword_results:
+                results["search_results"].update(keyword_result["search_results"])
+                results["search_method"].update(keyword_result["search_method"])
+                if "descriptions" in keyword_result:
+                    results.setdefault("descriptions", {}).update(keyword_result["descriptions"])
+                for key in ("debug", "errors"):
+                    if key in keyword_result:
+                        results[key] = keyword_result[key]
+    finally:
+        # 호출이 취소되더라도 예약된 파일 저장이 모두 끝날 때까지 대기 (저장에 실패한 결과 페이지의 file_path는 None)
+        outcomes = await asyncio.shield(asyncio.gather(*(write for _, _, write in pending_writes), return_exceptions=True))
+        for (result, filename, _), outcome in zip(pending_writes, outcomes):
+            if result is not None:
+                result['file_path'] = None if isinstance(outcome, Exception) else filename
     
     return results
 
@@ -0,0 +1,56 @@
+import asyncio
+import importlib.util
+import sys
+import types
+import unittest
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# main.py가 이 저장소에 없는 analyzer.keyword 모듈을 import하므로 빈 모듈로 자리만 채운 뒤 불러옴
+sys.modules.setdefault("analyzer.keyword", types.ModuleType("analyzer.keyword"))
+spec = importlib.util.spec_from_file_location("main", ROOT / "main.py")
+main = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(main)
+
+
+def _page_with_script_end_at(offset: int) -> bytes:
+    """
+    </script> 닫는 태그가 offset 바이트 위치에서 시작하고, 그 뒤 문단에만 키워드가 있는 페이지
+    """
+    head = b"<html><body><script>"
+    padding = b"x" * (offset - len(head))
+    return head + padding + b"</script><p>Climate change</p></body></html>"
+
+
+def _scan(body: bytes, keywords):
+    def handler(request):
+        return httpx.Response(200, headers={"Content-Type": "text/html; charset=utf-8"}, content=body)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await main._fetch_and_scan(client, "http://example.test/", main._KeywordPattern(keywords))
+
+    return asyncio.run(run())
+
+
+class FetchAndScanTest(unittest.TestCase):
+    def test_script_end_tag_across_chunk_boundary(self):
+        # 스트리밍 조각 경계가 </script> 안쪽에 걸려도 뒤쪽 문단의 키워드를 찾아야 함
+        for delta in range(1, len(b"</script>")):
+            offset = main.STREAM_CHUNK_SIZE - delta
+            with self.subTest(offset=offset):
+                page = _scan(_page_with_script_end_at(offset), ["climate"])
+                self.assertIsNotNone(page)
+                self.assertTrue(page[2])
+
+    def test_script_text_is_not_matched(self):
+        page = _scan(_page_with_script_end_at(100).replace(b"Climate", b"Weather"), ["x"])
+        self.assertFalse(page[2])
+
+
+if __name__ == "__main__":
+    unittest.main()